@@ -18,9 +18,8 @@ async def serve():
     container = make_async_container(AppProvider())
     try:
         logger.debug(f"Получение DocumentServiceServicer из DI-контейнера, event loop: {asyncio.get_running_loop()}")
-        # Создаем временный контекст запроса для получения сервисера
-        async with container() as request_container:
-            servicer = await request_container.get(DocumentServiceServicer)
+        # Сервисер и его зависимости не хранят состояния запроса, поэтому создаются один раз на приложение
+        servicer = await container.get(DocumentServiceServicer)
         server = grpc.aio.server(interceptors=[JWTAuthInterceptor()])
 
         # Добавляем сервисер
@@ -35,8 +34,9 @@ async def serve():
         logger.info("gRPC reflection enabled for DocumentService")
 
         # Запускаем сервер
-        server.add_insecure_port(f'[::]:{settings.GRPC_PORT}')
-        logger.info(f"gRPC server started on port {settings.GRPC_PORT}")
+        # add_insecure_port возвращает фактически занятый порт (важно при GRPC_PORT=0)
+        port = server.add_insecure_port(f'[::]:{settings.GRPC_PORT}')
+        logger.info(f"gRPC server started on port {port}")
         await server.start()
         await server.wait_for_termination()
     except Exception as e:
@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from src.domain.models.document import Document, DocumentVersion
+
+class DocumentCachePort(ABC):
+    """Outbound порт для кэширования документов, списков и версий."""
+
+    @abstractmethod
+    async def get_document(self, document_id: str) -> Optional[Document]:
+        pass
+
+    @abstractmethod
+    async def set_document(self, document: Document) -> None:
+        pass
+
+    @abstractmethod
+    async def get_document_list(self, skip: int, limit: int) -> Optional[List[Document]]:
+        pass
+
+    @abstractmethod
+    async def set_document_list(self, documents: List[Document], skip: int, limit: int) -> None:
+        pass
+
+    @abstractmethod
+    async def invalidate_document(self, document_id: str) -> None:
+        pass
+
+    @abstractmethod
+    async def get_document_versions(self, document_id: str) -> Optional[List[DocumentVersion]]:
+        pass
+
+    @abstractmethod
+    async def set_document_versions(self, document_id: str, versions: List[DocumentVersion]) -> None:
+        pass
+
+    @abstractmethod
+    async def invalidate_document_versions(self, document_id: str) -> None:
+        pass
+
+    @abstractmethod
+    async def invalidate_document_list(self) -> None:
+        pass
\ No newline at end of file
@@ -6,6 +6,14 @@ from src.domain.models.document import Document, DocumentStatus, DocumentVersion
 from src.domain.ports.outbound.mappers.base import BaseMapper
 from src.infra.adapters.outbound.mappers.utils import MapperUtils
 
+# Таблицы соответствия статусов строятся один раз при импорте, а не на каждое сообщение
+_DOMAIN_STATUS_BY_GRPC = {
+    service_pb2.DocumentStatus.DRAFT: DocumentStatus.DRAFT,
+    service_pb2.DocumentStatus.PUBLISHED: DocumentStatus.PUBLISHED,
+    service_pb2.DocumentStatus.ARCHIVED: DocumentStatus.ARCHIVED
+}
+_GRPC_STATUS_BY_DOMAIN = {domain: grpc for grpc, domain in _DOMAIN_STATUS_BY_GRPC.items()}
+
 class GrpcMapper(BaseMapper[Document]):
     """Маппер для преобразования между gRPC-сообщениями и доменными объектами."""
 
@@ -50,7 +58,7 @@ class GrpcMapper(BaseMapper[Document]):
             id=MapperUtils.serialize_uuid(document.id),
             title=document.title,
             content=document.content,
-            status=service_pb2.DocumentStatus.Value(document.status.value.upper()),
+            status=_GRPC_STATUS_BY_DOMAIN[document.status],
             author=document.author,
             tags=document.tags,
             category=document.category or "",
@@ -116,12 +124,7 @@ class GrpcMapper(BaseMapper[Document]):
     @staticmethod
     def _map_grpc_status_to_domain(grpc_status: int) -> DocumentStatus:
         """Преобразует gRPC статус в доменный DocumentStatus."""
-        status_map = {
-            service_pb2.DocumentStatus.DRAFT: DocumentStatus.DRAFT,
-            service_pb2.DocumentStatus.PUBLISHED: DocumentStatus.PUBLISHED,
-            service_pb2.DocumentStatus.ARCHIVED: DocumentStatus.ARCHIVED
-        }
         try:
-            return status_map[grpc_status]
+            return _DOMAIN_STATUS_BY_GRPC[grpc_status]
         except KeyError:
             raise ValueError(f"Неверный статус gRPC: {grpc_status}")
\ No newline at end of file
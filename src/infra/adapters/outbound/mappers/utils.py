@@ -1,8 +1,12 @@
-from typing import Any, List
+import orjson
+from typing import Any
 from uuid import UUID
 from datetime import datetime
 from src.domain.models.document import Document, DocumentVersion, DocumentStatus
 
+# Таблица статусов по значению: поиск в словаре дешевле, чем вызов DocumentStatus(value)
+_STATUS_BY_VALUE = {status.value: status for status in DocumentStatus}
+
 class MapperUtils:
     """Утилитные методы для сериализации/десериализации данных в мапперах."""
 
@@ -42,7 +46,20 @@ class MapperUtils:
     @staticmethod
     def deserialize_status(value: str) -> DocumentStatus:
         """Десериализует строку в DocumentStatus."""
-        return DocumentStatus(value)
+        try:
+            return _STATUS_BY_VALUE[value]
+        except KeyError:
+            raise ValueError(f"Неверное значение статуса: {value}")
+
+    @staticmethod
+    def dumps_json(obj: Any) -> str:
+        """Сериализует объект в JSON-строку через orjson (UUID, datetime и Enum поддерживаются нативно)."""
+        return orjson.dumps(obj).decode()
+
+    @staticmethod
+    def loads_json(data: Any) -> Any:
+        """Десериализует JSON-строку или байты через orjson."""
+        return orjson.loads(data)
 
     @staticmethod
     def to_json_serializable(obj: Any) -> Any:
@@ -89,12 +106,4 @@ class VersionMapper:
         document_dict['comments'] = document_dict.get('comments', [])
         document_dict['versions'] = []
         version_dict['document'] = Document(**document_dict)
-        return DocumentVersion(**version_dict)
-
-    @staticmethod
-    def to_storage_versions(versions: List[DocumentVersion], storage_type: str) -> Any:
-        """Сериализует список версий для хранилища."""
-        serialized = MapperUtils.to_json_serializable(versions)
-        if storage_type == "sql":
-            return [{"version_id": v["version_id"], "timestamp": v["timestamp"], "document_data": v["document"]} for v in serialized]
-        return serialized
\ No newline at end of file
+        return DocumentVersion(**version_dict)
\ No newline at end of file
@@ -57,10 +57,12 @@ class MongoDocumentAdapter(DocumentRepositoryPort):
             if not mongo_doc:
                 self.logger.warning(f"Документ с ID: {id} не найден или удален")
                 return None
+            # Одно чтение часов на обновление: время версии и updated_at совпадают
+            now = datetime.utcnow()
             current_version = DocumentVersion(
                 version_id=uuid4(),
                 document=self.mapper.to_domain_document(mongo_doc),
-                timestamp=datetime.utcnow()
+                timestamp=now
             )
             mongo_doc.versions.append(current_version)
             if data.title is not None:
@@ -77,7 +79,7 @@ class MongoDocumentAdapter(DocumentRepositoryPort):
                 mongo_doc.category = data.category
             if data.comments is not None:
                 mongo_doc.comments = data.comments
-            mongo_doc.updated_at = datetime.utcnow()
+            mongo_doc.updated_at = now
             await mongo_doc.save()
             return self.mapper.to_domain_document(mongo_doc)
         except (ConnectionFailure, OperationFailure) as e:
@@ -0,0 +1,33 @@
+from typing import List, Optional
+from src.domain.models.document import Document, DocumentVersion
+from src.domain.ports.outbound.cache.document import DocumentCachePort
+
+class NullCacheAdapter(DocumentCachePort):
+    """Пустой кэш для работы без Redis: чтение всегда промахивается, запись и инвалидация ничего не делают."""
+
+    async def get_document(self, document_id: str) -> Optional[Document]:
+        return None
+
+    async def set_document(self, document: Document) -> None:
+        pass
+
+    async def get_document_list(self, skip: int, limit: int) -> Optional[List[Document]]:
+        return None
+
+    async def set_document_list(self, documents: List[Document], skip: int, limit: int) -> None:
+        pass
+
+    async def invalidate_document(self, document_id: str) -> None:
+        pass
+
+    async def get_document_versions(self, document_id: str) -> Optional[List[DocumentVersion]]:
+        return None
+
+    async def set_document_versions(self, document_id: str, versions: List[DocumentVersion]) -> None:
+        pass
+
+    async def invalidate_document_versions(self, document_id: str) -> None:
+        pass
+
+    async def invalidate_document_list(self) -> None:
+        pass
\ No newline at end of file
@@ -1,15 +1,21 @@
-import json
 from typing import List, Optional
 from redis.asyncio import Redis
 from redis.exceptions import RedisError
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 from src.domain.models.document import Document, DocumentVersion
+from src.domain.ports.outbound.cache.document import DocumentCachePort
 from src.infra.adapters.outbound.redis.mapper import RedisMapper
-from src.infra.config.settings import settings
+from src.infra.config.settings import CACHE_TTL
 import logging
 from src.domain.exceptions.base import BaseAppException
 
-class RedisCacheAdapter:
+# Версия в ключе списков: формат записи сменился с массива JSON-строк на массив объектов,
+# поэтому записи старого формата просто не находятся в кэше, а не ломают чтение
+_DOCUMENT_LIST_KEY = "documents:v2:skip={skip}:limit={limit}"
+# При инвалидации удаляются и оставшиеся ключи старого формата
+_DOCUMENT_LIST_KEY_PATTERNS = ("documents:v2:skip=*:limit=*", "documents:skip=*:limit=*")
+
+class RedisCacheAdapter(DocumentCachePort):
     def __init__(self, redis_client: Redis):
         self.redis_client = redis_client
         self.mapper = RedisMapper()
@@ -40,7 +46,7 @@ class RedisCacheAdapter:
         self.logger.debug(f"Сохранение документа в кэш: {document.id}")
         try:
             serialized_data = self.mapper.to_storage(document)
-            await self.redis_client.setex(f"document:{document.id}", settings.CACHE_TTL, serialized_data)
+            await self.redis_client.setex(f"document:{document.id}", CACHE_TTL, serialized_data)
             self.logger.debug(f"Документ успешно закэширован: {document.id}")
         except RedisError as e:
             self.logger.error(f"Ошибка при сохранении документа в кэш: {str(e)}")
@@ -53,14 +59,13 @@ class RedisCacheAdapter:
     )
     async def get_document_list(self, skip: int, limit: int) -> Optional[List[Document]]:
         """Получает список документов из кэша."""
-        cache_key = f"documents:skip={skip}:limit={limit}"
+        cache_key = _DOCUMENT_LIST_KEY.format(skip=skip, limit=limit)
         self.logger.debug(f"Получение списка документов из кэша: {cache_key}")
         try:
             cached_data = await self.redis_client.get(cache_key)
             if cached_data:
                 self.logger.debug(f"Кэш-попадание для списка документов: {cache_key}")
-                doc_list = json.loads(cached_data)
-                return [self.mapper.from_storage(doc_data) for doc_data in doc_list]
+                return self.mapper.from_storage_list(cached_data)
             return None
         except RedisError as e:
             self.logger.error(f"Ошибка при получении списка документов из кэша: {str(e)}")
@@ -73,11 +78,11 @@ class RedisCacheAdapter:
     )
     async def set_document_list(self, documents: List[Document], skip: int, limit: int) -> None:
         """Сохраняет список документов в кэш."""
-        cache_key = f"documents:skip={skip}:limit={limit}"
+        cache_key = _DOCUMENT_LIST_KEY.format(skip=skip, limit=limit)
         self.logger.debug(f"Сохранение списка документов в кэш: {cache_key}")
         try:
-            serialized_list = [self.mapper.to_storage(doc) for doc in documents]
-            await self.redis_client.setex(cache_key, settings.CACHE_TTL, json.dumps(serialized_list))
+            serialized_list = self.mapper.to_storage_list(documents)
+            await self.redis_client.setex(cache_key, CACHE_TTL, serialized_list)
             self.logger.debug(f"Список документов успешно закэширован: {cache_key}")
         except RedisError as e:
             self.logger.error(f"Ошибка при сохранении списка документов в кэш: {str(e)}")
@@ -123,7 +128,7 @@ class RedisCacheAdapter:
         self.logger.debug(f"Сохранение версий документа в кэш: {document_id}")
         try:
             serialized_data = self.mapper.to_storage_versions(versions)
-            await self.redis_client.setex(f"document_versions:{document_id}", settings.CACHE_TTL, serialized_data)
+            await self.redis_client.setex(f"document_versions:{document_id}", CACHE_TTL, serialized_data)
             self.logger.debug(f"Версии документа успешно закэшированы: {document_id}")
         except RedisError as e:
             self.logger.error(f"Ошибка при сохранении версий документа в кэш: {str(e)}")
@@ -153,7 +158,9 @@ class RedisCacheAdapter:
         """Инвалидирует кэш списков документов."""
         self.logger.debug("Инвалидация кэша списка документов")
         try:
-            keys = await self.redis_client.keys("documents:skip=*:limit=*")
+            keys = []
+            for pattern in _DOCUMENT_LIST_KEY_PATTERNS:
+                keys.extend(await self.redis_client.keys(pattern))
             if keys:
                 await self.redis_client.delete(*keys)
                 self.logger.debug(f"Инвалидировано {len(keys)} записей кэша списка документов")
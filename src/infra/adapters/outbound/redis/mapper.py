@@ -1,20 +1,43 @@
-import json
-from typing import List, Optional
+import orjson
+from typing import List
 from src.domain.models.document import Document, DocumentVersion
 from src.domain.ports.outbound.mappers.base import BaseMapper
 from src.infra.adapters.outbound.mappers.utils import MapperUtils, VersionMapper
 
 class RedisMapper(BaseMapper[Document]):
-    """Маппер для сериализации/десериализации данных в Redis."""
+    """Маппер для сериализации/десериализации данных в Redis.
 
-    def to_storage(self, obj: Document) -> str:
-        """Сериализует Document в JSON-строку для Redis."""
-        doc_dict = MapperUtils.to_json_serializable(obj)
-        return json.dumps(doc_dict)
+    Redis-клиент работает без decode_responses, поэтому данные передаются как bytes
+    и разбираются orjson без промежуточного декодирования в str.
+    """
 
-    def from_storage(self, data: str) -> Document:
-        """Десериализует JSON-строку из Redis в Document."""
-        doc_dict = json.loads(data)
+    def to_storage(self, obj: Document) -> bytes:
+        """Сериализует Document в JSON для Redis."""
+        return orjson.dumps(obj.model_dump())
+
+    def from_storage(self, data: bytes) -> Document:
+        """Десериализует JSON из Redis в Document."""
+        return self._to_domain_document(orjson.loads(data))
+
+    def to_storage_list(self, documents: List[Document]) -> bytes:
+        """Сериализует список Document в JSON-массив для Redis."""
+        return orjson.dumps([doc.model_dump() for doc in documents])
+
+    def from_storage_list(self, data: bytes) -> List[Document]:
+        """Десериализует JSON-массив из Redis в список Document."""
+        return [self._to_domain_document(doc_dict) for doc_dict in orjson.loads(data)]
+
+    def to_storage_versions(self, versions: List[DocumentVersion]) -> bytes:
+        """Сериализует список DocumentVersion в JSON для Redis."""
+        return orjson.dumps([version.model_dump() for version in versions])
+
+    def from_storage_versions(self, data: bytes) -> List[DocumentVersion]:
+        """Десериализует JSON из Redis в список DocumentVersion."""
+        versions_data = orjson.loads(data)
+        return [VersionMapper.to_domain_version(v, "redis") for v in versions_data]
+
+    def _to_domain_document(self, doc_dict: dict) -> Document:
+        """Преобразует разобранный JSON-словарь в доменный Document."""
         doc_dict['id'] = MapperUtils.deserialize_uuid(doc_dict['id'])
         doc_dict['created_at'] = MapperUtils.deserialize_datetime(doc_dict['created_at'])
         doc_dict['updated_at'] = MapperUtils.deserialize_datetime(doc_dict['updated_at'])
@@ -22,13 +45,4 @@ class RedisMapper(BaseMapper[Document]):
         doc_dict['tags'] = doc_dict.get('tags', [])
         doc_dict['comments'] = doc_dict.get('comments', [])
         doc_dict['versions'] = [VersionMapper.to_domain_version(v, "redis") for v in doc_dict.get('versions', [])]
-        return Document(**doc_dict)
-
-    def to_storage_versions(self, versions: List[DocumentVersion]) -> str:
-        """Сериализует список DocumentVersion в JSON-строку для Redis."""
-        return json.dumps(VersionMapper.to_storage_versions(versions, "redis"))
-
-    def from_storage_versions(self, data: str) -> List[DocumentVersion]:
-        """Десериализует JSON-строку из Redis в список DocumentVersion."""
-        versions_data = json.loads(data)
-        return [VersionMapper.to_domain_version(v, "redis") for v in versions_data]
\ No newline at end of file
+        return Document(**doc_dict)
\ No newline at end of file
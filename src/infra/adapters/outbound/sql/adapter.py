@@ -1,5 +1,6 @@
 import logging
-from typing import List, Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
 from uuid import UUID, uuid4
 from datetime import datetime
 from sqlalchemy import select
@@ -19,18 +20,29 @@ class SQLDocumentAdapter(DocumentRepositoryPort):
         self.logger = logging.getLogger(__name__)
         self.mapper = SQLMapper()
 
+    @asynccontextmanager
+    async def _read_only_session(self) -> AsyncIterator[AsyncSession]:
+        """Открывает сессию с транзакцией READ ONLY для операций чтения.
+
+        Флаг postgresql_readonly применяется к соединению до BEGIN, поэтому
+        транзакция сразу стартует как READ ONLY без дополнительного запроса.
+        """
+        async with self.session_factory() as session:
+            async with session.begin():
+                await session.connection(execution_options={"postgresql_readonly": True})
+                yield session
+
     async def get_by_id(self, id: UUID) -> Optional[Document]:
         self.logger.info(f"Fetching document from PostgreSQL with ID: {id}")
         try:
-            async with self.session_factory() as session:
-                async with session.begin():
-                    result = await session.execute(
-                        select(SQLDocument)
-                        .where(SQLDocument.id == id, SQLDocument.is_deleted == False)
-                        .options(selectinload(SQLDocument.versions))
-                    )
-                    sql_doc = result.scalars().first()
-                    return self.mapper.to_domain_document(sql_doc) if sql_doc else None
+            async with self._read_only_session() as session:
+                result = await session.execute(
+                    select(SQLDocument)
+                    .where(SQLDocument.id == id, SQLDocument.is_deleted == False)
+                    .options(selectinload(SQLDocument.versions))
+                )
+                sql_doc = result.scalars().first()
+                return self.mapper.to_domain_document(sql_doc) if sql_doc else None
         except SQLAlchemyError as e:
             self.logger.error(f"PostgreSQL error while fetching document {id}: {str(e)}")
             raise BaseAppException(f"Failed to fetch document due to database error: {str(e)}")
@@ -63,11 +75,13 @@ class SQLDocumentAdapter(DocumentRepositoryPort):
                         self.logger.warning(f"Document with ID: {id} not found or deleted")
                         return None
 
+                    # Одно чтение часов на обновление: время версии и updated_at совпадают
+                    now = datetime.utcnow()
                     current_version = SQLDocumentVersion(
                         version_id=uuid4(),
                         document_id=sql_doc.id,
-                        document_data=self.mapper.to_storage(self.mapper.to_domain_document(sql_doc)),
-                        timestamp=datetime.utcnow()
+                        document_data=self.mapper.to_snapshot(sql_doc),
+                        timestamp=now
                     )
                     sql_doc.versions.append(current_version)
 
@@ -85,7 +99,7 @@ class SQLDocumentAdapter(DocumentRepositoryPort):
                         sql_doc.category = data.category
                     if data.comments is not None:
                         sql_doc.comments = data.comments
-                    sql_doc.updated_at = datetime.utcnow()
+                    sql_doc.updated_at = now
                     await session.flush()
                     return self.mapper.to_domain_document(sql_doc)
         except SQLAlchemyError as e:
@@ -120,17 +134,17 @@ class SQLDocumentAdapter(DocumentRepositoryPort):
     async def list_documents(self, skip: int, limit: int) -> List[Document]:
         self.logger.info(f"Listing documents from PostgreSQL with skip: {skip}, limit: {limit}")
         try:
-            async with self.session_factory() as session:
-                async with session.begin():
-                    result = await session.execute(
-                        select(SQLDocument)
-                        .where(SQLDocument.is_deleted == False)
-                        .offset(skip)
-                        .limit(limit)
-                        .options(selectinload(SQLDocument.versions))
-                    )
-                    sql_docs = result.scalars().all()
-                    return [self.mapper.to_domain_document(doc) for doc in sql_docs]
+            async with self._read_only_session() as session:
+                result = await session.execute(
+                    select(SQLDocument)
+                    .where(SQLDocument.is_deleted == False)
+                    .offset(skip)
+                    .limit(limit)
+                    .options(selectinload(SQLDocument.versions))
+                )
+                sql_docs = result.scalars().all()
+                to_domain_document = self.mapper.to_domain_document
+                return [to_domain_document(doc) for doc in sql_docs]
         except SQLAlchemyError as e:
             self.logger.error(f"PostgreSQL error while listing documents: {str(e)}")
             raise BaseAppException(f"Failed to list documents due to database error: {str(e)}")
@@ -160,15 +174,17 @@ class SQLDocumentAdapter(DocumentRepositoryPort):
     async def get_versions(self, id: UUID) -> List[DocumentVersion]:
         self.logger.info(f"Fetching versions for document from PostgreSQL with ID: {id}")
         try:
-            async with self.session_factory() as session:
-                async with session.begin():
-                    result = await session.execute(
-                        select(SQLDocument)
-                        .where(SQLDocument.id == id)
-                        .options(selectinload(SQLDocument.versions))
-                    )
-                    sql_doc = result.scalars().first()
-                    return [self.mapper.to_version(v) for v in sql_doc.versions] if sql_doc else []
+            async with self._read_only_session() as session:
+                result = await session.execute(
+                    select(SQLDocument)
+                    .where(SQLDocument.id == id)
+                    .options(selectinload(SQLDocument.versions))
+                )
+                sql_doc = result.scalars().first()
+                if not sql_doc:
+                    return []
+                to_version = self.mapper.to_version
+                return [to_version(v) for v in sql_doc.versions]
         except SQLAlchemyError as e:
             self.logger.error(f"PostgreSQL error while fetching versions for document {id}: {str(e)}")
             raise BaseAppException(f"Failed to fetch versions due to database error: {str(e)}")
\ No newline at end of file
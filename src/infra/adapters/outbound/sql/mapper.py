@@ -13,25 +13,24 @@ class SQLMapper(BaseMapper[Document]):
         """Преобразует SQLDocument в доменный Document."""
         if not sql_document:
             return None
-        doc_dict = {
-            'id': sql_document.id,
-            'title': sql_document.title,
-            'content': sql_document.content,
-            'status': sql_document.status,
-            'author': sql_document.author,
-            'tags': list(sql_document.tags) if sql_document.tags else [],
-            'category': sql_document.category,
-            'comments': list(sql_document.comments) if sql_document.comments else [],
-            'created_at': sql_document.created_at,
-            'updated_at': sql_document.updated_at,
-            'is_deleted': sql_document.is_deleted,
-            'versions': [VersionMapper.to_domain_version(v, "sql") for v in sql_document.versions]
-        }
-        doc_dict['id'] = MapperUtils.deserialize_uuid(doc_dict['id'])
-        doc_dict['created_at'] = MapperUtils.deserialize_datetime(doc_dict['created_at'])
-        doc_dict['updated_at'] = MapperUtils.deserialize_datetime(doc_dict['updated_at'])
-        doc_dict['status'] = MapperUtils.deserialize_status(doc_dict['status'])
-        return Document(**doc_dict)
+        # Строка уже прошла ограничения схемы, а поля приведены к типам выше,
+        # поэтому повторная валидация Pydantic для самого документа не нужна.
+        # Версии по-прежнему валидируются в VersionMapper: JSONB-снимок хранит
+        # UUID и даты строками, и без валидации они не будут приведены к типам
+        return Document.model_construct(
+            id=MapperUtils.deserialize_uuid(sql_document.id),
+            title=sql_document.title,
+            content=sql_document.content,
+            status=MapperUtils.deserialize_status(sql_document.status),
+            author=sql_document.author,
+            tags=list(sql_document.tags) if sql_document.tags else [],
+            category=sql_document.category,
+            comments=list(sql_document.comments) if sql_document.comments else [],
+            created_at=MapperUtils.deserialize_datetime(sql_document.created_at),
+            updated_at=MapperUtils.deserialize_datetime(sql_document.updated_at),
+            is_deleted=sql_document.is_deleted,
+            versions=[self.to_version(v) for v in sql_document.versions]
+        )
 
     def to_sql_document(self, document: Document) -> SQLDocument:
         """Преобразует доменный Document в SQLDocument."""
@@ -49,9 +48,21 @@ class SQLMapper(BaseMapper[Document]):
             is_deleted=document.is_deleted
         )
 
+    def to_version(self, sql_version: SQLDocumentVersion) -> DocumentVersion:
+        """Преобразует SQLDocumentVersion в доменную DocumentVersion."""
+        return VersionMapper.to_domain_version(sql_version, "sql")
+
+    def to_snapshot(self, sql_document: SQLDocument) -> dict:
+        """Формирует JSONB-снимок текущего состояния SQLDocument для истории версий."""
+        return self.to_storage(self.to_domain_document(sql_document))
+
     def to_storage(self, document: Document) -> dict:
-        """Сериализует Document в JSON-сериализуемый словарь для JSONB."""
-        return MapperUtils.to_json_serializable(document)
+        """Сериализует Document в словарь для JSONB.
+
+        UUID, datetime и DocumentStatus остаются нативными объектами: их сериализует
+        json_serializer движка (MapperUtils.dumps_json).
+        """
+        return document.model_dump()
 
     def from_storage(self, data: SQLDocument) -> Document:
         """Десериализует SQLDocument в Document."""
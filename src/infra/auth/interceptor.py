@@ -20,16 +20,16 @@ class JWTAuthInterceptor(grpc.aio.ServerInterceptor):
         """Перехватывает gRPC-запросы для проверки авторизации."""
         method_name = handler_call_details.method.split('/')[-1]
         full_method = handler_call_details.method
-        self.logger.debug(f"Обрабатывается метод: {method_name}, Полный путь: {full_method}")
+        self.logger.debug("Обрабатывается метод: %s, Полный путь: %s", method_name, full_method)
 
         # Пропустить проверку авторизации для методов рефлексии gRPC
         if full_method.startswith('/grpc.reflection.'):
-            self.logger.debug(f"Пропуск проверки авторизации для метода рефлексии: {full_method}")
+            self.logger.debug("Пропуск проверки авторизации для метода рефлексии: %s", full_method)
             return await continuation(handler_call_details)
 
         # Пропустить проверку авторизации для публичных методов
         if method_name in self.public_methods:
-            self.logger.debug(f"Пропуск проверки авторизации для публичного метода: {method_name}")
+            self.logger.debug("Пропуск проверки авторизации для публичного метода: %s", method_name)
             return await continuation(handler_call_details)
 
         # Пропустить проверку авторизации, если JWT отключён
@@ -46,11 +46,11 @@ class JWTAuthInterceptor(grpc.aio.ServerInterceptor):
         async def auth_wrapper(request, context: grpc.aio.ServicerContext):
             try:
                 metadata = dict(context.invocation_metadata())
-                self.logger.debug(f"Получены метаданные: {metadata}")
+                self.logger.debug("Получены метаданные: %s", metadata)
                 token = metadata.get("authorization")
 
                 if not token:
-                    self.logger.warning(f"JWT токен отсутствует для метода: {method_name}, peer: {context.peer()}")
+                    self.logger.warning("JWT токен отсутствует для метода: %s, peer: %s", method_name, context.peer())
                     await context.abort(
                         grpc.StatusCode.UNAUTHENTICATED,
                         "Токен авторизации отсутствует"
@@ -59,22 +59,22 @@ class JWTAuthInterceptor(grpc.aio.ServerInterceptor):
                 if token.startswith("Bearer "):
                     token = token[7:]
                 payload = self.jwt_utils.decode_token(token)
-                self.logger.debug(f"Токен успешно проверен, payload: {payload}")
+                self.logger.debug("Токен успешно проверен, payload: %s", payload)
 
                 # Вызов метода unary_unary обработчика
                 if hasattr(handler, 'unary_unary'):
                     return await handler.unary_unary(request, context)
                 else:
-                    self.logger.error(f"Обработчик для {method_name} не является unary_unary")
+                    self.logger.error("Обработчик для %s не является unary_unary", method_name)
                     await context.abort(grpc.StatusCode.INTERNAL, "Неверный тип обработчика")
 
             except JWTAuthException as e:
-                self.logger.error(f"Ошибка авторизации для метода {method_name}: {str(e)}")
+                self.logger.error("Ошибка авторизации для метода %s: %s", method_name, e)
                 await context.abort(grpc.StatusCode.UNAUTHENTICATED, str(e))
             except grpc._cython.cygrpc.AbortError:
                 raise  # Повторно выбрасываем, чтобы завершить abort
             except Exception as e:
-                self.logger.error(f"Неожиданная ошибка при проверке токена для метода {method_name}: {str(e)}", exc_info=True)
+                self.logger.error("Неожиданная ошибка при проверке токена для метода %s: %s", method_name, e, exc_info=True)
                 await context.abort(grpc.StatusCode.INTERNAL, "Внутренняя ошибка сервера")
 
         # Возвращаем новый обработчик с обёрткой авторизации
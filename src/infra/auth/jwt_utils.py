@@ -1,7 +1,11 @@
+import functools
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, Optional
+import time
+from typing import Any, Dict
 import jwt
+import orjson
+from jwt import PyJWK
+from jwt.utils import base64url_encode
 from src.infra.config.settings import settings
 from src.domain.exceptions.base import BaseAppException
 
@@ -13,6 +17,31 @@ class JWTAuthException(BaseAppException):
         return "Ошибка авторизации"
 
 
+class _OrjsonPyJWT(jwt.PyJWT):
+    """PyJWT с разбором payload через orjson вместо стандартного json."""
+
+    def _decode_payload(self, decoded: Dict[str, Any]) -> Any:
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except orjson.JSONDecodeError as e:
+            raise jwt.DecodeError(f"Invalid payload string: {e}")
+        if not isinstance(payload, dict):
+            raise jwt.DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+
+_jwt = _OrjsonPyJWT()
+
+
+@functools.lru_cache(maxsize=4096)
+def _decode(token: str, key: PyJWK) -> Dict:
+    """Проверяет подпись и декодирует JWT-токен; результат кэшируется по строке токена.
+
+    Исключения не кэшируются, поэтому неверные токены проверяются заново при каждом вызове.
+    """
+    return _jwt.decode(token, key, algorithms=[key.algorithm_name])
+
+
 class JWTUtils:
     """Утилиты для работы с JWT-токенами."""
 
@@ -21,30 +50,45 @@ class JWTUtils:
         self.secret_key = settings.JWT_SECRET_KEY
         self.algorithm = settings.JWT_ALGORITHM
         self.token_ttl = settings.JWT_TOKEN_TTL
+        # Ключ HMAC подготавливается один раз; PyJWK позволяет PyJWT не вызывать prepare_key на каждой проверке
+        self._jwk = PyJWK(
+            {"kty": "oct", "k": base64url_encode(self.secret_key.encode()).decode()},
+            algorithm=self.algorithm
+        )
+        # Заголовок одинаков для всех токенов экземпляра, поэтому его сегмент кодируется один раз
+        self._header_segment = base64url_encode(orjson.dumps({"alg": self.algorithm, "typ": "JWT"}))
 
     def create_token(self, payload: Dict) -> str:
         """Создает JWT-токен с указанным payload."""
         try:
-            payload["exp"] = datetime.utcnow() + timedelta(seconds=self.token_ttl)
-            token = jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
+            payload["exp"] = int(time.time()) + self.token_ttl
+            # Подписываем напрямую через алгоритм и ключ, подготовленные в PyJWK:
+            # PyJWT.encode заново искал бы алгоритм и вызывал prepare_key на каждый токен
+            signing_input = self._header_segment + b"." + base64url_encode(orjson.dumps(payload))
+            signature = self._jwk.Algorithm.sign(signing_input, self._jwk.key)
+            token = (signing_input + b"." + base64url_encode(signature)).decode()
             self.logger.debug("JWT-токен успешно создан")
             return token
         except Exception as e:
-            self.logger.error(f"Ошибка при создании JWT-токена: {str(e)}")
+            self.logger.error("Ошибка при создании JWT-токена: %s", e)
             raise JWTAuthException(f"Не удалось создать токен: {str(e)}")
 
     def decode_token(self, token: str) -> Dict:
         """Декодирует и проверяет JWT-токен."""
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+            payload = _decode(token, self._jwk)
+            # Закэшированный payload мог истечь после первой проверки
+            exp = payload.get("exp")
+            if exp is not None and exp <= time.time():
+                raise jwt.ExpiredSignatureError("Signature has expired")
             self.logger.debug("JWT-токен успешно декодирован")
-            return payload
+            return dict(payload)
         except jwt.ExpiredSignatureError:
             self.logger.warning("JWT-токен истек")
             raise JWTAuthException("Токен истек")
         except jwt.InvalidTokenError as e:
-            self.logger.warning(f"Неверный JWT-токен: {str(e)}")
+            self.logger.warning("Неверный JWT-токен: %s", e)
             raise JWTAuthException("Неверный токен")
         except Exception as e:
-            self.logger.error(f"Ошибка при декодировании JWT-токена: {str(e)}")
+            self.logger.error("Ошибка при декодировании JWT-токена: %s", e)
             raise JWTAuthException(f"Ошибка декодирования токена: {str(e)}")
\ No newline at end of file
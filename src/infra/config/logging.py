@@ -1,15 +1,43 @@
+import atexit
 import logging
+import logging.config
+import logging.handlers
+import queue
 import sys
+from typing import Optional
 from src.infra.config.settings import settings
 
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
 def setup_logging():
-    logging.basicConfig(
-        level=getattr(logging, settings.LOG_LEVEL.upper()),
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-        handlers=[
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
-    # Устанавливаем уровень логирования для всех модулей
-    logging.getLogger("motor").setLevel(logging.WARNING)
-    logging.getLogger("asyncio").setLevel(logging.WARNING)
\ No newline at end of file
+    """Настраивает логирование один раз за процесс.
+
+    Обработчики пишут записи в очередь, а форматирование и вывод в stdout выполняет
+    фоновый поток QueueListener, поэтому запись логов не блокирует event loop.
+    """
+    global _listener
+    if _listener is not None:
+        return
+    logging.config.dictConfig({
+        "version": 1,
+        "disable_existing_loggers": False,
+        "loggers": {
+            # Устанавливаем уровень логирования для шумных библиотек
+            "motor": {"level": "WARNING"},
+            "asyncio": {"level": "WARNING"},
+        },
+        "root": {
+            "level": settings.LOG_LEVEL.upper(),
+        },
+    })
+    # QueueHandler создаётся вручную: начиная с Python 3.12 dictConfig обрабатывает его
+    # особым образом и требует ключ "handlers", которого здесь нет
+    log_queue: queue.Queue = queue.Queue(-1)
+    logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    _listener = logging.handlers.QueueListener(log_queue, stdout_handler)
+    _listener.start()
+    atexit.register(_listener.stop)
\ No newline at end of file
@@ -1,16 +1,16 @@
 from dishka import Provider, Scope, provide
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator, Callable, Optional
 from src.domain.ports.inbound.services.document import DocumentServicePort
 from src.domain.ports.outbound.repository.document import DocumentRepositoryPort
 from src.application.document.service import DocumentService
 from src.infra.adapters.inbound.grpc.adapter import DocumentServiceServicer
-from src.infra.adapters.outbound.mongo.adapter import MongoDocumentAdapter
-from src.infra.adapters.outbound.sql.adapter import SQLDocumentAdapter
 from src.infra.config.settings import settings, DatabaseType
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from redis.asyncio import Redis, ConnectionPool
+from redis.asyncio import Redis, BlockingConnectionPool
+from src.domain.ports.outbound.cache.document import DocumentCachePort
 from src.infra.adapters.outbound.redis.adapter import RedisCacheAdapter
-from src.infra.adapters.outbound.redis.mapper import RedisMapper
+from src.infra.adapters.outbound.null.adapter import NullCacheAdapter
+from src.infra.adapters.outbound.mappers.utils import MapperUtils
 import logging
 from logging import Logger
 
@@ -20,32 +20,91 @@ class AppProvider(Provider):
     def __init__(self):
         super().__init__()
         self.logger: Logger = logging.getLogger(__name__)
-        self.engine = None  # Для хранения AsyncEngine
+        # Тип базы данных не меняется во время работы, поэтому фабрика репозитория выбирается один раз
+        self._repository_factory = self._resolve_repository_factory()
+
+    def _resolve_repository_factory(self) -> Callable[[Optional[async_sessionmaker[AsyncSession]]], DocumentRepositoryPort]:
+        """Выбирает фабрику репозитория в зависимости от типа базы данных."""
+        factories = {
+            DatabaseType.MONGO: self._create_mongo_repository,
+            DatabaseType.POSTGRES: self._create_sql_repository,
+        }
+        try:
+            return factories[settings.DB_TYPE]
+        except KeyError:
+            self.logger.error("Неподдерживаемый тип базы данных")
+            raise ValueError("Неподдерживаемый тип базы данных")
+
+    # Адаптеры импортируются лениво, чтобы не загружать драйвер неиспользуемой базы данных
+
+    def _create_mongo_repository(self, session_factory: Optional[async_sessionmaker[AsyncSession]]) -> DocumentRepositoryPort:
+        """Создает MongoDocumentAdapter; фабрика сессий не используется."""
+        from src.infra.adapters.outbound.mongo.adapter import MongoDocumentAdapter
+        return MongoDocumentAdapter()
+
+    def _create_sql_repository(self, session_factory: Optional[async_sessionmaker[AsyncSession]]) -> DocumentRepositoryPort:
+        """Создает SQLDocumentAdapter с фабрикой сессий."""
+        from src.infra.adapters.outbound.sql.adapter import SQLDocumentAdapter
+        if session_factory is None:
+            self.logger.error("Session factory is required for PostgreSQL")
+            raise ValueError("Session factory is required for PostgreSQL")
+        return SQLDocumentAdapter(session_factory)
 
     @provide(scope=Scope.APP)
-    def provide_session_factory(self) -> Optional[async_sessionmaker[AsyncSession]]:
-        """Предоставляет фабрику сессий для PostgreSQL."""
+    async def provide_session_factory(self) -> AsyncGenerator[Optional[async_sessionmaker[AsyncSession]], None]:
+        """Предоставляет фабрику сессий для PostgreSQL.
+
+        Engine закрывается при закрытии контейнера (container.close()).
+        """
         if settings.DB_TYPE == DatabaseType.POSTGRES:
             self.logger.debug("Инициализация async_sessionmaker для PostgreSQL")
-            self.engine = create_async_engine(settings.DB_URL, echo=True)
-            return async_sessionmaker(
-                self.engine,
-                class_=AsyncSession,
-                expire_on_commit=False,
-                autobegin=False
+            engine = create_async_engine(
+                settings.DB_URL,
+                echo=settings.LOG_LEVEL.upper() == "DEBUG",
+                hide_parameters=settings.LOG_LEVEL.upper() != "DEBUG",
+                pool_size=settings.DB_POOL_SIZE,
+                max_overflow=settings.DB_MAX_OVERFLOW,
+                pool_recycle=settings.DB_POOL_RECYCLE,
+                pool_use_lifo=True,
+                json_serializer=MapperUtils.dumps_json,
+                json_deserializer=MapperUtils.loads_json
             )
+            try:
+                yield async_sessionmaker(
+                    engine,
+                    class_=AsyncSession,
+                    expire_on_commit=False,
+                    autobegin=False
+                )
+            finally:
+                await engine.dispose()
+                self.logger.debug("Database engine disposed")
         elif settings.DB_TYPE == DatabaseType.MONGO:
             self.logger.debug("No session factory needed for MongoDB")
-            return None
+            yield None
         else:
             self.logger.error("Неподдерживаемый тип базы данных")
             raise ValueError("Неподдерживаемый тип базы данных")
 
     @provide(scope=Scope.APP)
-    async def provide_redis(self) -> AsyncGenerator[Redis, None]:
-        """Предоставляет клиент Redis с пулом соединений."""
+    async def provide_redis(self) -> AsyncGenerator[Optional[Redis], None]:
+        """Предоставляет клиент Redis с пулом соединений.
+
+        Ответы не декодируются в str: RedisCacheAdapter получает bytes и разбирает их через orjson.
+        Если кэш отключён (CACHE_ENABLED=false или CACHE_TTL <= 0), клиент не создаётся.
+        """
+        if not settings.CACHE_ENABLED or settings.CACHE_TTL <= 0:
+            self.logger.debug("Кэш отключён, клиент Redis не создаётся")
+            yield None
+            return
         self.logger.debug("Инициализация клиента Redis")
-        pool = ConnectionPool.from_url(settings.REDIS_URL, decode_responses=True)
+        # Ограниченный пул: при исчерпании соединений запрос ждёт свободное, а не получает ошибку
+        pool = BlockingConnectionPool.from_url(
+            settings.REDIS_URL,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+            socket_keepalive=True
+        )
         redis = Redis(connection_pool=pool)
         try:
             yield redis
@@ -55,42 +114,27 @@ class AppProvider(Provider):
             self.logger.debug("Клиент Redis закрыт")
 
     @provide(scope=Scope.APP)
-    async def provide_cache(self, redis: Redis) -> RedisCacheAdapter:
-        """Предоставляет адаптер кэша Redis."""
+    async def provide_cache(self, redis: Optional[Redis]) -> DocumentCachePort:
+        """Предоставляет адаптер кэша: Redis или пустой кэш, если Redis отключён."""
+        if redis is None:
+            self.logger.debug("Инициализация NullCacheAdapter")
+            return NullCacheAdapter()
         self.logger.debug("Инициализация RedisCacheAdapter")
         return RedisCacheAdapter(redis)
 
-    @provide(scope=Scope.REQUEST)
+    @provide(scope=Scope.APP)
     async def provide_repository(self, session_factory: Optional[async_sessionmaker[AsyncSession]]) -> DocumentRepositoryPort:
         """Предоставляет репозиторий в зависимости от типа базы данных."""
-        self.logger.debug(f"Предоставление репозитория для DB_TYPE: {settings.DB_TYPE}")
-        if settings.DB_TYPE == DatabaseType.MONGO:
-            return MongoDocumentAdapter()
-        elif settings.DB_TYPE == DatabaseType.POSTGRES:
-            if session_factory is None:
-                self.logger.error("Session factory is required for PostgreSQL")
-                raise ValueError("Session factory is required for PostgreSQL")
-            self.logger.debug("Создание SQLDocumentAdapter с session_factory")
-            return SQLDocumentAdapter(session_factory)
-        else:
-            self.logger.error("Неподдерживаемый тип базы данных")
-            raise ValueError("Неподдерживаемый тип базы данных")
+        return self._repository_factory(session_factory)
 
-    @provide(scope=Scope.REQUEST)
-    async def provide_service(self, repository: DocumentRepositoryPort, cache: RedisCacheAdapter) -> DocumentServicePort:
+    @provide(scope=Scope.APP)
+    async def provide_service(self, repository: DocumentRepositoryPort, cache: DocumentCachePort) -> DocumentServicePort:
         """Предоставляет сервис для работы с документами."""
         self.logger.debug("Инициализация DocumentService")
         return DocumentService(repository, cache)
 
-    @provide(scope=Scope.REQUEST)
+    @provide(scope=Scope.APP)
     async def provide_grpc_servicer(self, service: DocumentServicePort) -> DocumentServiceServicer:
         """Предоставляет gRPC сервис для обработки запросов."""
         self.logger.debug("Инициализация DocumentServiceServicer")
-        return DocumentServiceServicer(service)
-
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Закрывает AsyncEngine при завершении работы контейнера."""
-        self.logger.debug("Closing DI container")
-        if self.engine:
-            await self.engine.dispose()
-            self.logger.debug("Database engine disposed")
\ No newline at end of file
+        return DocumentServiceServicer(service)
\ No newline at end of file
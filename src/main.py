@@ -1,35 +1,59 @@
 import asyncio
-from beanie import init_beanie
-from motor.motor_asyncio import AsyncIOMotorClient
 from src.infra.config.settings import settings, DatabaseType
-from src.infra.adapters.outbound.mongo.models import MongoDocument
-from src.infra.adapters.outbound.sql.models import Base
-from sqlalchemy.ext.asyncio import create_async_engine
 from src.app import serve
 import logging
 from src.infra.config.logging import setup_logging
 
+# Драйверы импортируются внутри функций: загружается только стек выбранной базы данных
+
+async def _init_mongo():
+    from beanie import init_beanie
+    from motor.motor_asyncio import AsyncIOMotorClient
+    from src.infra.adapters.outbound.mongo.models import MongoDocument
+    logger = logging.getLogger(__name__)
+    client = AsyncIOMotorClient(settings.DB_URL)
+    await init_beanie(database=client[settings.DB_NAME], document_models=[MongoDocument])
+    logger.info("MongoDB successfully initialized")
+
+async def _init_postgres():
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import NullPool
+    from src.infra.adapters.outbound.sql.models import Base
+    logger = logging.getLogger(__name__)
+    logger.debug("Creating PostgreSQL async engine")
+    engine = create_async_engine(
+        settings.DB_URL,
+        echo=settings.LOG_LEVEL.upper() == "DEBUG",
+        hide_parameters=settings.LOG_LEVEL.upper() != "DEBUG",
+        # Engine живёт одну транзакцию create_all, пул соединений ему не нужен
+        poolclass=NullPool
+    )
+    logger.debug(f"Async engine created: {engine}")
+    try:
+        async with engine.begin() as conn:
+            logger.debug("Creating tables")
+            await conn.run_sync(Base.metadata.create_all)  # Только создание таблиц
+    finally:
+        # Engine нужен только для создания таблиц; рабочий engine создаётся в DI
+        await engine.dispose()
+    logger.info("PostgreSQL successfully initialized")
+
+_DB_INITIALIZERS = {
+    DatabaseType.MONGO: _init_mongo,
+    DatabaseType.POSTGRES: _init_postgres,
+}
+
 async def init_db():
     setup_logging()
     logger = logging.getLogger(__name__)
     logger.info(f"Initializing database: {settings.DB_TYPE}")
     try:
-        if settings.DB_TYPE == DatabaseType.MONGO:
-            client = AsyncIOMotorClient(settings.DB_URL)
-            await init_beanie(database=client[settings.DB_NAME], document_models=[MongoDocument])
-            logger.info("MongoDB successfully initialized")
-        elif settings.DB_TYPE == DatabaseType.POSTGRES:
-            logger.debug("Creating PostgreSQL async engine")
-            engine = create_async_engine(settings.DB_URL, echo=True)
-            logger.debug(f"Async engine created: {engine}")
-            async with engine.begin() as conn:
-                logger.debug("Creating tables")
-                await conn.run_sync(Base.metadata.create_all)  # Только создание таблиц
-            # Не закрываем engine здесь, так как он используется в DI
-            logger.info("PostgreSQL successfully initialized")
-        else:
+        try:
+            initializer = _DB_INITIALIZERS[settings.DB_TYPE]
+        except KeyError:
             logger.error("Unsupported database type")
             raise ValueError("Unsupported database type")
+        await initializer()
     except Exception as e:
         logger.error(f"Failed to initialize database: {str(e)}", exc_info=True)
         raise